@@ -20,7 +20,7 @@ Heuristics (improve later):
 Exit code 0 even if orphans exist (validation script enforces later).
 """
 from __future__ import annotations
-import re, pathlib, os
+import re, pathlib, os, hashlib
 from collections import defaultdict
 
 ROOT = pathlib.Path(__file__).resolve().parent.parent
@@ -35,83 +35,83 @@ PATTERNS = {
     'scenario': re.compile(r'QA-SC-\d{3}'),
     'test': re.compile(r'TEST-[A-Z0-9-]+'),
 }
+# Single-pass scanner over all categories, dispatched on match.lastgroup. TEST ids are
+# matched inside a lookahead so IDs embedded in them (e.g. TEST-REQ-F-001) are still found.
+COMBINED = re.compile('|'.join(
+    f'(?=(?P<{key}>{pat.pattern}))' if key == 'test' else f'(?P<{key}>{pat.pattern})'
+    for key, pat in PATTERNS.items()
+))
 
-files = [p for p in ROOT.rglob('*.md') if 'node_modules' not in p.parts and 'reports' not in p.parts]
+# Directories pruned during the walk (never descended into, unlike rglob-then-filter)
+SKIP_DIRS = {'node_modules', 'reports', '.git', 'build'}
+
+files: list[pathlib.Path] = []
+for dirpath, dirnames, filenames in os.walk(ROOT):
+    dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+    files.extend(pathlib.Path(dirpath) / f for f in filenames if f.endswith('.md'))
 index: dict[str, set[str]] = {k: set() for k in PATTERNS}
 occurrence: dict[str, dict[str, set[pathlib.Path]]] = {k: defaultdict(set) for k in PATTERNS}
+reqs_in_file: dict[pathlib.Path, set[str]] = {}  # requirement IDs found per file during the scan
+ids_by_digest: dict[bytes, dict[str, set[str]]] = {}  # content hash -> IDs per category (dedups identical files)
 
 for path in files:
     try:
         text = path.read_text(encoding='utf-8', errors='ignore')
     except Exception:
         continue
-    for key, pat in PATTERNS.items():
-        for match in pat.findall(text):
-            index[key].add(match)
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+    ids = ids_by_digest.get(digest)
+    if ids is None:
+        ids = {k: set() for k in PATTERNS}
+        for m in COMBINED.finditer(text):
+            ids[m.lastgroup].add(m.group(m.lastgroup))
+        ids_by_digest[digest] = ids
+    for key, found in ids.items():
+        index[key].update(found)
+        for match in found:
             occurrence[key][match].add(path)
+    reqs_in_file[path] = ids['requirement']
 
 # Simple linkage inference
 req_links = defaultdict(set)  # requirement -> linked identifiers (adr/component/scenario/test)
-for adr in index['adr']:
-    # parse requirements referenced in ADR file names or contents
-    for req in index['requirement']:
-        for path in occurrence['adr'][adr]:
-            if req in path.read_text(encoding='utf-8', errors='ignore'):
-                req_links[req].add(adr)
-for scen in index['scenario']:
-    scen_text_files = occurrence['scenario'][scen]
-    text = '\n'.join(p.read_text(encoding='utf-8', errors='ignore') for p in scen_text_files)
-    for req in index['requirement']:
-        if req in text:
-            req_links[req].add(scen)
-for comp in index['component']:
-    comp_in_files = occurrence['component'][comp]
-    text = '\n'.join(p.read_text(encoding='utf-8', errors='ignore') for p in comp_in_files)
-    for req in index['requirement']:
-        if req in text:
-            req_links[req].add(comp)
+for key in ('adr', 'scenario', 'component'):
+    # a requirement is linked to an ADR/scenario/component if both appear in the same file
+    for id_ in index[key]:
+        for path in occurrence[key][id_]:
+            for req in reqs_in_file[path]:
+                req_links[req].add(id_)
 for test in index['test']:
     # naive: if test id includes requirement id substring (rare) skip, else can't infer; placeholder
     pass
 
 # Orphan detection
+all_linked = set().union(*req_links.values())  # every id linked to at least one requirement
 orphans = {
-    'requirements_no_links': sorted([r for r in index['requirement'] if not req_links.get(r)]),
-    'scenarios_no_req': sorted([
-        s for s in index['scenario']
-        if not any(s in links for links in req_links.values())
-    ]),
-    'components_no_req': sorted([
-        c for c in index['component']
-        if not any(c in links for links in req_links.values())
-    ]),
-    'adrs_no_req': sorted([
-        a for a in index['adr']
-        if not any(a in links for links in req_links.values())
-    ]),
+    'requirements_no_links': sorted(r for r in index['requirement'] if not req_links.get(r)),
+    'scenarios_no_req': sorted(s for s in index['scenario'] if s not in all_linked),
+    'components_no_req': sorted(c for c in index['component'] if c not in all_linked),
+    'adrs_no_req': sorted(a for a in index['adr'] if a not in all_linked),
 }
 
-matrix_lines = [
-    '# Traceability Matrix (Heuristic Draft)',
-    '',
-    '| Requirement | Linked Elements (ADR / Component / Scenario / Test) |',
-    '|-------------|----------------------------------------------------|',
-]
-for req in sorted(index['requirement']):
-    linked = ', '.join(sorted(req_links.get(req, []))) or '(none)'
-    matrix_lines.append(f'| {req} | {linked} |')
-
-(REPORTS / 'traceability-matrix.md').write_text('\n'.join(matrix_lines), encoding='utf-8')
+# Reports are streamed straight to disk rather than built up as line lists and joined
+with (REPORTS / 'traceability-matrix.md').open('w', encoding='utf-8', buffering=1 << 20) as f:
+    f.write(
+        '# Traceability Matrix (Heuristic Draft)\n'
+        '\n'
+        '| Requirement | Linked Elements (ADR / Component / Scenario / Test) |\n'
+        '|-------------|----------------------------------------------------|'
+    )
+    for req in sorted(index['requirement']):
+        linked = ', '.join(sorted(req_links.get(req, []))) or '(none)'
+        f.write(f'\n| {req} | {linked} |')
 
-orphan_lines = ['# Orphan Analysis', '']
-for category, items in orphans.items():
-    orphan_lines.append(f'## {category}')
-    if not items:
-        orphan_lines.append('- None')
-    else:
-        for item in items:
-            orphan_lines.append(f'- {item}')
-    orphan_lines.append('')
-(REPORTS / 'orphans.md').write_text('\n'.join(orphan_lines), encoding='utf-8')
+with (REPORTS / 'orphans.md').open('w', encoding='utf-8', buffering=1 << 20) as f:
+    f.write('# Orphan Analysis\n')
+    for category, items in orphans.items():
+        f.write(f'\n## {category}\n')
+        if not items:
+            f.write('- None\n')
+        else:
+            f.writelines(f'- {item}\n' for item in items)
 
 print('Generated reports/traceability-matrix.md and reports/orphans.md')
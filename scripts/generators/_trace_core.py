@@ -0,0 +1,109 @@
+"""Shared traceability model builder.
+
+Turns the spec-index item list into forward/backward link maps plus coverage
+metrics. Used by build_trace_json.py; keep entry points thin wrappers around
+build_trace so fixes land in one place.
+"""
+from __future__ import annotations
+from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Dict, List, Literal
+
+PREFIX_ORDER = ['StR', 'REQ', 'ARC', 'ADR', 'QA', 'TEST']
+# Requirement linkage dimensions: target prefix -> metrics key per key style
+REQ_LINK_TARGETS = {
+    'ADR': {'friendly': 'requirement_to_ADR', 'raw': 'req_to_adr'},
+    'QA': {'friendly': 'requirement_to_scenario', 'raw': 'req_to_scenario'},
+    'TEST': {'friendly': 'requirement_to_test', 'raw': 'req_to_test'},
+}
+
+KeyStyle = Literal['raw', 'friendly']
+
+
+def _prefix_key(prefix: str, key_style: KeyStyle) -> str:
+    # 'friendly' keys are lower-case with REQ spelled out; 'raw' keys are the ID prefix itself
+    if key_style == 'raw':
+        return prefix
+    return prefix.lower() if prefix != 'REQ' else 'requirement'
+
+
+def build_trace(items: List[Dict[str, Any]], key_style: KeyStyle = 'friendly') -> Dict[str, Any]:
+    # Deduplicated, sorted refs: smaller JSON output and each backward link recorded once
+    forward = {i['id']: sorted(set(i.get('references', []))) for i in items}
+    # Group (target, source) pairs instead of appending into per-key lists
+    pairs = sorted((r, src) for src, refs in forward.items() for r in refs)
+    backward = {r: tuple(src for _, src in grp) for r, grp in groupby(pairs, key=itemgetter(0))}
+
+    # Single pass over items: per-prefix completeness counts plus the reverse
+    # requirement linkage sets contributed by ADR/QA/TEST items.
+    # We consider a requirement linked to ADR/Scenario/Test if EITHER:
+    #  (a) The requirement lists a forward reference to an ADR/QA/TEST item, OR
+    #  (b) Any ADR/QA/TEST item lists a reference to the requirement (backward inference)
+    # This symmetric approach prevents under-reporting when only downstream artifacts
+    # embed the linkage (common when ADRs or scenarios enumerate the driving REQs).
+    totals = defaultdict(int)
+    with_links = defaultdict(int)
+    req_ids = []
+    reverse_links = {t: defaultdict(set) for t in REQ_LINK_TARGETS}  # target prefix -> requirement -> set(ids)
+    for itm in items:
+        iid = itm['id']
+        prefix = next((p for p in PREFIX_ORDER if iid.startswith(p)), None)
+        if prefix is None:
+            continue
+        totals[prefix] += 1
+        if any(forward[iid]):
+            with_links[prefix] += 1
+        if prefix == 'REQ':
+            req_ids.append(iid)
+        elif prefix in reverse_links:
+            for ref in forward[iid]:
+                if ref.startswith('REQ'):
+                    reverse_links[prefix][ref].add(iid)
+
+    # Simple completeness metrics
+    metrics = {}
+    for prefix in PREFIX_ORDER:
+        total = totals[prefix]
+        metrics[_prefix_key(prefix, key_style)] = {
+            'total': total,
+            'with_links': with_links[prefix],
+            'coverage_pct': (with_links[prefix] / total * 100) if total else 100.0,
+        }
+
+    # Requirement-specific linkage dimensions, all targets gathered in one pass over req_ids
+    req_to = {t: 0 for t in REQ_LINK_TARGETS}
+    req_details = {t: {} for t in REQ_LINK_TARGETS}
+    for rid in req_ids:
+        fwd_by_target = {t: [] for t in REQ_LINK_TARGETS}
+        for r in forward.get(rid, []):
+            # Bucket by the ID prefix ('ADR-003' -> 'ADR'): one split + lookup per ref
+            # instead of a startswith test against every target prefix.
+            bucket = fwd_by_target.get(r.split('-', 1)[0])
+            if bucket is not None:
+                bucket.append(r)
+        for t in REQ_LINK_TARGETS:
+            rev_set = reverse_links[t].get(rid, set())
+            if fwd_by_target[t] or rev_set:
+                req_to[t] += 1
+            req_details[t][rid] = {
+                'forward_refs': fwd_by_target[t],
+                'reverse_refs': sorted(rev_set),
+            }
+
+    for target, keys in REQ_LINK_TARGETS.items():
+        count_total = len(req_ids)
+        metrics[keys[key_style]] = {
+            'total_requirements': count_total,
+            'requirements_with_link': req_to[target],
+            'coverage_pct': (req_to[target] / count_total * 100) if count_total else 100.0,
+            'details': req_details[target],
+            'inference': 'forward+backward'
+        }
+
+    return {
+        'items': items,
+        'forward': forward,
+        'backward': backward,
+        'metrics': metrics,
+    }
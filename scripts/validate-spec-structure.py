@@ -11,18 +11,27 @@ Exit codes:
  2 internal error
 """
 from __future__ import annotations
-import sys, re, json, subprocess, pathlib, typing as t
+import sys, re, json, subprocess, pathlib, functools, typing as t
+from concurrent.futures import ProcessPoolExecutor
 
 try:
     import yaml  # type: ignore
 except ImportError:
     print("Missing dependency pyyaml. Install with: pip install pyyaml jsonschema", file=sys.stderr)
     sys.exit(2)
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml-backed, much faster when available
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore
 try:
     import jsonschema  # type: ignore
 except ImportError:
     print("Missing dependency jsonschema. Install with: pip install jsonschema", file=sys.stderr)
     sys.exit(2)
+try:
+    import fastjsonschema  # type: ignore  # optional: compiles schemas into specialised Python
+except ImportError:
+    fastjsonschema = None
 
 ROOT = pathlib.Path(__file__).resolve().parent.parent
 SCHEMA_DIR = ROOT / 'spec-kit-templates' / 'schemas'
@@ -32,6 +41,8 @@ SCHEMA_MAP = {
 }
 
 FRONT_MATTER_RE = re.compile(r'^---\n(.*?)\n---', re.DOTALL)
+REQ_BODY_RE = re.compile(r'REQ-(?:F|NF)-\d{3}')
+ADR_BODY_RE = re.compile(r'ADR-\d{3}')
 
 class ValidationIssue(t.NamedTuple):
     file: pathlib.Path
@@ -39,17 +50,20 @@ class ValidationIssue(t.NamedTuple):
 
 
 def extract_front_matter(text: str) -> t.Optional[str]:
+    if not text.startswith('---\n'):  # cheap reject before running the regex
+        return None
     m = FRONT_MATTER_RE.match(text)
     return m.group(1) if m else None
 
 
 def parse_yaml_block(block: str) -> t.Optional[dict]:
     try:
-        return yaml.safe_load(block) or {}
+        return yaml.load(block, Loader=_YamlLoader) or {}
     except Exception as e:
         return None
 
 
+@functools.lru_cache(maxsize=None)
 def load_schema(spec_type: str) -> dict:
     p = SCHEMA_MAP.get(spec_type)
     if not p or not p.exists():
@@ -57,6 +71,20 @@ def load_schema(spec_type: str) -> dict:
     return json.loads(p.read_text(encoding='utf-8'))
 
 
+@functools.lru_cache(maxsize=None)
+def _validator(spec_type: str) -> 'jsonschema.Draft7Validator':
+    # Built once per spec type and shared by every file of that type
+    return jsonschema.Draft7Validator(load_schema(spec_type))
+
+
+@functools.lru_cache(maxsize=None)
+def _fast_validator(spec_type: str) -> t.Optional[t.Callable[[dict], t.Any]]:
+    # Code-generated check for the common all-valid case; None when fastjsonschema is absent
+    if fastjsonschema is None:
+        return None
+    return fastjsonschema.compile(load_schema(spec_type))
+
+
 def validate_spec(path: pathlib.Path) -> list[ValidationIssue]:
     issues: list[ValidationIssue] = []
     text = path.read_text(encoding='utf-8', errors='ignore')
@@ -73,22 +101,30 @@ def validate_spec(path: pathlib.Path) -> list[ValidationIssue]:
         issues.append(ValidationIssue(path, 'Missing specType in front matter'))
         return issues
     try:
-        schema = load_schema(spec_type)
+        fast_check = _fast_validator(spec_type)
+        validator = _validator(spec_type)
     except Exception as e:
         issues.append(ValidationIssue(path, f'Schema load error: {e}'))
         return issues
-    validator = jsonschema.Draft7Validator(schema)
-    for err in validator.iter_errors(meta):
-        issues.append(ValidationIssue(path, f"Schema violation: {'/'.join(map(str, err.path)) or '<root>'}: {err.message}"))
+    schema_ok = False
+    if fast_check is not None:
+        try:
+            fast_check(meta)
+            schema_ok = True
+        except fastjsonschema.JsonSchemaValueException:
+            pass  # re-run jsonschema below to report every violation, not just the first
+    if not schema_ok:
+        for err in validator.iter_errors(meta):
+            issues.append(ValidationIssue(path, f"Schema violation: {'/'.join(map(str, err.path)) or '<root>'}: {err.message}"))
 
     # Additional cross-field custom checks
     if spec_type == 'requirements':
         # Ensure at least one Functional (REQ-F-) or Non-Functional (REQ-NF-) ID present in body
-        if not re.search(r'REQ-(F|NF)-\d{3}', text):
+        if not REQ_BODY_RE.search(text):
             issues.append(ValidationIssue(path, 'No REQ-* identifiers found in body'))
     if spec_type == 'architecture':
         # Ensure at least one ARC-C- or ADR reference
-        if not re.search(r'ADR-\d{3}', text):
+        if not ADR_BODY_RE.search(text):
             issues.append(ValidationIssue(path, 'No ADR-XXX references found in architecture spec'))
     return issues
 
@@ -110,11 +146,12 @@ def main(argv: list[str]) -> int:
     if not targets:
         print('No spec files found to validate', file=sys.stderr)
         return 0
+    targets = [p for p in targets if not p.name.startswith('README')]  # skip readmes
+    # Files validate independently; fan out across processes and report in input order
+    with ProcessPoolExecutor() as ex:
+        results = list(ex.map(validate_spec, targets, chunksize=8))
     all_issues: list[ValidationIssue] = []
-    for path in targets:
-        if path.name.startswith('README'):  # skip readmes
-            continue
-        issues = validate_spec(path)
+    for path, issues in zip(targets, results):
         if issues:
             for issue in issues:
                 print(f"❌ {issue.file.relative_to(ROOT)}: {issue.message}")
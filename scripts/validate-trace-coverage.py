@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """Validate traceability coverage thresholds.
 
-Reads build/traceability.json and enforces minimum linkage coverage for:
+Reads build/traceability-metrics.json (falling back to the full
+build/traceability.json when the sidecar is missing) and enforces minimum
+linkage coverage for:
  - Requirements (REQ-*) overall
  - ADR linkage (percent requirements with ≥1 ADR)
  - Scenario linkage (percent requirements with ≥1 scenario)
@@ -33,8 +35,23 @@ from __future__ import annotations
 import argparse, json, sys
 from pathlib import Path
 
+try:
+    import orjson  # type: ignore  # optional C-backed JSON codec
+except ImportError:
+    orjson = None
+
 ROOT = Path(__file__).resolve().parents[1]
 TRACE_JSON = ROOT / 'build' / 'traceability.json'
+METRICS_JSON = ROOT / 'build' / 'traceability-metrics.json'  # metrics-only sidecar written alongside TRACE_JSON
+
+def load_trace(path: Path) -> dict:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding='utf-8'))
+
+def metrics_source() -> Path:
+    # Prefer the small sidecar so the items/forward/backward payload is never parsed
+    return METRICS_JSON if METRICS_JSON.exists() else TRACE_JSON
 
 def parse_args():
     ap = argparse.ArgumentParser()
@@ -46,10 +63,11 @@ def parse_args():
 
 def main() -> int:
     args = parse_args()
-    if not TRACE_JSON.exists():
+    source = metrics_source()
+    if not source.exists():
         print('traceability.json missing; ensure spec-generation job ran first', file=sys.stderr)
         return 1
-    data = json.loads(TRACE_JSON.read_text(encoding='utf-8'))
+    data = load_trace(source)
     metrics = data.get('metrics', {})
     def get_cov(key_aliases):
         for k in key_aliases: